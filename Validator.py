@@ -4,19 +4,145 @@ PioneerOS System Validation Suite
 Tests all components before flashing to Raspberry Pi
 """
 
+import io
 import os
 import sys
 import json
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_GREEN = '\033[92m'
+_RED = '\033[91m'
+_YELLOW = '\033[93m'
+_BLUE = '\033[94m'
+_END = '\033[0m'
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    END = '\033[0m'
+    GREEN = _GREEN
+    RED = _RED
+    YELLOW = _YELLOW
+    BLUE = _BLUE
+    END = _END
+
+_INV_MB = 1.0 / 1048576.0
+_INV_GB = 1.0 / 1073741824.0
+
+# Expected sdcard.img size range, in bytes
+_IMG_MIN_BYTES = 3 * 2**29  # 1.5 GB
+_IMG_MAX_BYTES = 4 * 2**30
+
+_FIRMWARE_FILES = frozenset({"start4.elf", "fixup4.dat"})
+_UTILITIES = frozenset({"htop", "nano", "file"})
+
+# status -> (symbol, color, summary counter)
+_STATUS = {
+    "PASS": ("✓", _GREEN, "passed"),
+    "FAIL": ("✗", _RED, "failed"),
+    "WARN": ("⚠", _YELLOW, "warnings"),
+}
+
+@dataclass(frozen=True)
+class TestSpec:
+    """Declarative path-based check, run by PioneerValidator._run_spec"""
+    name: str
+    kind: str                # "exists", "size", "content" or "group"
+    paths: tuple             # attribute names in PioneerValidator.P
+    pass_msg: str            # may use {path}, and {found}/{total} for "group"
+    fail_msg: str
+    fail_status: str = "FAIL"
+    fail_details: str = ""
+    needles: tuple = ()      # "content": byte strings that must all be present
+    warn_msg: str = ""       # "content": file present but needles missing
+
+# Run order for run_all_tests: TestSpec rows, or the name of a custom
+# test_* method where the check does not fit a row
+_TESTS = [
+    # Critical tests
+    TestSpec("Image File", "size", ("sdcard",),
+             "Found at {path}", "sdcard.img not found",
+             fail_details="Expected at {path}"),
+    TestSpec("Kernel Image", "size", ("kernel",),
+             "Linux kernel found", "Kernel not found"),
+    TestSpec("Device Tree", "exists", ("dtb",),
+             "BCM2711 DTB found", "DTB for RPi4 not found"),
+    TestSpec("Root Filesystem", "size", ("rootfs",),
+             "ext4 rootfs found", "rootfs.ext4 not found"),
+    TestSpec("Boot Partition", "exists", ("boot_vfat",),
+             "boot.vfat created", "boot.vfat not found"),
+    # Software tests
+    TestSpec("Python3", "group", ("python", "python_lib"),
+             "Found {found}/{total} components", "Python3 not found in rootfs"),
+    "test_opencv_libs",
+    TestSpec("SSH Server", "group", ("dropbear", "dropbear_init"),
+             "Dropbear found ({found}/{total} files)", "Dropbear not found"),
+    TestSpec("I2C Tools", "exists", ("i2cdetect",),
+             "i2cdetect found", "i2c-tools not confirmed", fail_status="WARN"),
+    # Configuration tests
+    TestSpec("Network Config", "content", ("net_config",),
+             "Static IP configured (192.168.1.10)", "Network interfaces file missing",
+             needles=(b"192.168.1.10", b"eth0"),
+             warn_msg="Config exists but may be incomplete"),
+    "test_wifi_config",
+    TestSpec("Custom Overlay", "exists", ("startup_script",),
+             "Robotics startup script present", "Startup script not found",
+             fail_status="WARN"),
+    # System tests
+    "test_kernel_modules",
+    "test_utilities",
+    "test_firmware_files",
+    "test_image_size",
+    TestSpec("Toolchain", "exists", ("gcc",),
+             "Cross-compiler present", "Cross-compiler not found", fail_status="WARN"),
+]
+
+def _dumps(obj):
+    """Serialize obj to compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+# Target subtrees indexed by _index_target() -> descend into subdirectories
+_INDEXED_DIRS = {
+    "usr/bin": False,
+    "usr/sbin": False,
+    "usr/lib": True,
+    "etc/init.d": False,
+}
+
+def _entry_exists(entry):
+    """Like Path.exists() for a DirEntry: dangling symlinks are missing"""
+    return not entry.is_symlink() or os.path.exists(entry.path)
+
+def _scan_tree(root, recursive=True):
+    """Yield every os.DirEntry under root with a single scandir walk
+
+    An unreadable root raises OSError; unreadable subdirectories are skipped.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            if path is root:
+                raise
+            continue
+        with it:
+            for entry in it:
+                yield entry
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
 
 class PioneerValidator:
     def __init__(self, buildroot_path="/mnt/data/buildroot"):
@@ -26,116 +152,308 @@ class PioneerValidator:
         self.target = self.output / "target"
         self.host = self.output / "host"
         
+        # Fixed layout, resolved once; str paths go straight to os.* calls
+        self.P = SimpleNamespace(
+            sdcard=str(self.images / "sdcard.img"),
+            kernel=str(self.images / "Image"),
+            dtb=str(self.images / "bcm2711-rpi-4-b.dtb"),
+            rootfs=str(self.images / "rootfs.ext4"),
+            boot_vfat=str(self.images / "boot.vfat"),
+            rpi_firmware=str(self.images / "rpi-firmware"),
+            python=str(self.target / "usr/bin/python3"),
+            python_lib=str(self.target / "usr/lib/python3.11"),
+            usr_bin=str(self.target / "usr/bin"),
+            usr_sbin=str(self.target / "usr/sbin"),
+            dropbear=str(self.target / "usr/sbin/dropbear"),
+            dropbear_init=str(self.target / "etc/init.d/S50dropbear"),
+            i2cdetect=str(self.target / "usr/sbin/i2cdetect"),
+            modules=str(self.target / "lib/modules"),
+            startup_script=str(self.target / "etc/init.d/S99robotics"),
+            wpa_conf=str(self.target / "etc/wpa_supplicant.conf"),
+            net_config=str(self.buildroot / "board/raspberrypi/overlay/etc/network/interfaces"),
+            gcc=str(self.host / "bin/aarch64-buildroot-linux-gnu-gcc"),
+        )
+        
+        # Test entries are streamed to the report as they are logged
+        # (opened on first use, see _open_report), so only the summary
+        # is kept in memory
         self.results = {
             "timestamp": datetime.now().isoformat(),
-            "tests": {},
             "summary": {"passed": 0, "failed": 0, "warnings": 0}
         }
+        self._summary = self.results["summary"]
+        self.report_path = self.buildroot / "validation_report.json"
+        self._report_tmp = self.report_path.with_name(self.report_path.name + ".tmp")
+        self._report_fh = None
+        self._report_sep = b""
+        self._report_error = None
+        self._stat_cache = {}
+        self._listings = {}
+        self._target_prefix = str(self.target) + os.sep
+        self._index = {}
+        self._index_roots = {}
+        self._lock = threading.Lock()
+        # Set per worker thread by _run_job to hold that test's records
+        self._tls = threading.local()
+        # Log lines are buffered and written once in generate_report,
+        # unless stdout is a terminal where live progress is more useful
+        self._buffered = not sys.stdout.isatty()
+        self._out = io.StringIO()
     
     def log(self, status, test_name, message, details=""):
         """Log test result"""
-        symbol = "✓" if status == "PASS" else "✗" if status == "FAIL" else "⚠"
-        color = Colors.GREEN if status == "PASS" else Colors.RED if status == "FAIL" else Colors.YELLOW
-        
-        print(f"{color}{symbol} {test_name}{Colors.END}: {message}")
-        if details:
-            print(f"  {details}")
-        
-        self.results["tests"][test_name] = {
-            "status": status,
-            "message": message,
-            "details": details
-        }
-        
-        if status == "PASS":
-            self.results["summary"]["passed"] += 1
-        elif status == "FAIL":
-            self.results["summary"]["failed"] += 1
+        pending = getattr(self._tls, "pending", None)
+        if pending is not None:
+            pending.append((status, test_name, message, details))
         else:
-            self.results["summary"]["warnings"] += 1
+            self._emit(status, test_name, message, details)
     
-    def run_cmd(self, cmd, cwd=None):
-        """Run shell command and return output"""
+    def _emit(self, status, test_name, message, details):
+        """Print a result, stream it to the report and count it"""
+        symbol, color, key = _STATUS[status]
+        
+        with self._lock:
+            line = f"{color}{symbol} {test_name}{_END}: {message}\n"
+            if details:
+                line += f"  {details}\n"
+            (self._out if self._buffered else sys.stdout).write(line)
+            
+            if self._report_fh is None and self._report_error is None:
+                self._open_report()
+            if self._report_fh is not None:
+                entry = _dumps({test_name: {
+                    "status": status,
+                    "message": message,
+                    "details": details
+                }})[1:-1]
+                self._write_report(self._report_sep + b"    " + entry)
+                self._report_sep = b",\n"
+            
+            self._summary[key] += 1
+    
+    def _flush_output(self):
+        """Write any buffered log lines to stdout"""
+        with self._lock:
+            buffered, self._out = self._out.getvalue(), io.StringIO()
+        sys.stdout.write(buffered)
+    
+    def _run_job(self, job):
+        """Run one test in a worker, holding back its log records"""
+        self._tls.pending = records = []
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, 
-                text=True, cwd=cwd, timeout=10
-            )
-            return result.returncode == 0, result.stdout, result.stderr
-        except Exception as e:
-            return False, "", str(e)
+            job()
+        finally:
+            self._tls.pending = None
+        return records
     
-    def test_image_exists(self):
-        """Test 1: Check SD card image exists"""
-        img_path = self.images / "sdcard.img"
-        if img_path.exists():
-            size_mb = img_path.stat().st_size / (1024**2)
-            self.log("PASS", "Image File", f"Found at {img_path}", 
-                    f"Size: {size_mb:.1f} MB")
-        else:
-            self.log("FAIL", "Image File", "sdcard.img not found", 
-                    f"Expected at {img_path}")
-    
-    def test_kernel_exists(self):
-        """Test 2: Check kernel image"""
-        kernel = self.images / "Image"
-        if kernel.exists():
-            size_mb = kernel.stat().st_size / (1024**2)
-            self.log("PASS", "Kernel Image", "Linux kernel found", 
-                    f"Size: {size_mb:.1f} MB")
+    def _open_report(self):
+        """Start the JSON report and stream test entries into it"""
+        # Written beside the real report and swapped in by _close_report,
+        # so an aborted run leaves the previous report intact
+        try:
+            self._report_fh = open(self._report_tmp, 'wb')
+        except OSError as e:
+            # A report that can't be written must not stop the validation;
+            # streaming stays off and generate_report prints the error
+            self._report_error = e
+            return
+        self._report_sep = b""
+        timestamp = _dumps(self.results["timestamp"])
+        self._write_report(b'{\n  "timestamp": ' + timestamp + b',\n  "tests": {\n')
+    
+    def _write_report(self, data):
+        """Append to the report, dropping it on a write error"""
+        try:
+            self._report_fh.write(data)
+        except OSError as e:
+            self._report_error = e
+            self._discard_report()
+    
+    def _close_report(self):
+        """Append the summary and finish the JSON report"""
+        summary = _dumps(self.results["summary"])
+        self._write_report(b'\n  },\n  "summary": ' + summary + b'\n}\n')
+        if self._report_fh is None:
+            return
+        try:
+            self._report_fh.close()
+            self._report_fh = None
+            os.replace(self._report_tmp, self.report_path)
+        except OSError as e:
+            self._report_error = e
+            self._discard_report()
+    
+    def _discard_report(self):
+        """Drop a partially written report"""
+        fh, self._report_fh = self._report_fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                pass
+        try:
+            os.remove(self._report_tmp)
+        except OSError:
+            pass
+    
+    # Probe helpers: use _stat() when the test needs st_size (it is cached
+    # and shared between tests), _exists() for a plain yes/no, and
+    # _present() for paths that may lie under the target index.
+    
+    def _stat(self, path):
+        """Return cached os.stat() result for path, or None if missing"""
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        self._stat_cache[path] = st
+        return st
+    
+    def _exists(self, path):
+        """Existence check via access(), without building a stat result"""
+        return os.access(path, os.F_OK)
+    
+    def _index_dir(self, sub):
+        """Add target/sub to the layout index, keyed by target-relative path"""
+        root = os.path.join(str(self.target), sub)
+        try:
+            entries = list(_scan_tree(root, _INDEXED_DIRS.get(sub, False)))
+        except OSError:
+            self._index_roots[sub] = None
+            return
+        start = len(self._target_prefix)
+        for entry in entries:
+            self._index[entry.path[start:]] = entry
+        self._index_roots[sub] = entries
+    
+    def _index_target(self):
+        """Index the target subtrees the tests look at in one pass"""
+        for sub in _INDEXED_DIRS:
+            self._index_dir(sub)
+    
+    def _subtree(self, sub):
+        """Return DirEntries under target/sub (None if missing), indexing once"""
+        if sub not in self._index_roots:
+            self._index_dir(sub)
+        return self._index_roots[sub]
+    
+    def _listing(self, d):
+        """Return the set of names in d (None if unreadable), reading it once"""
+        if d not in self._listings:
+            try:
+                with os.scandir(d) as it:
+                    self._listings[d] = {e.name for e in it if _entry_exists(e)}
+            except OSError:
+                self._listings[d] = None
+        return self._listings[d]
+    
+    def _present(self, path):
+        """Check path against the target index, else probe it"""
+        if path.startswith(self._target_prefix):
+            rel = path[len(self._target_prefix):]
+            for sub in self._index_roots:
+                if not rel.startswith(sub + "/"):
+                    continue
+                if _INDEXED_DIRS.get(sub) or "/" not in rel[len(sub) + 1:]:
+                    entry = self._index.get(rel)
+                    return entry is not None and _entry_exists(entry)
+        
+        return self._exists(path)
+    
+    def _run_spec(self, spec):
+        """Execute one declarative TestSpec"""
+        paths = [getattr(self.P, key) for key in spec.paths]
+        runner = getattr(self, f"_run_{spec.kind}")
+        runner(spec, paths)
+    
+    def _spec_fail(self, spec, path):
+        """Log the spec's failure status and message"""
+        self.log(spec.fail_status, spec.name, spec.fail_msg,
+                 spec.fail_details.format(path=path))
+    
+    def _run_exists(self, spec, paths):
+        """Spec kind "exists": path is present"""
+        path = paths[0]
+        if self._present(path):
+            self.log("PASS", spec.name, spec.pass_msg.format(path=path))
         else:
-            self.log("FAIL", "Kernel Image", "Kernel not found")
+            self._spec_fail(spec, path)
     
-    def test_dtb_exists(self):
-        """Test 3: Check device tree blob"""
-        dtb = self.images / "bcm2711-rpi-4-b.dtb"
-        if dtb.exists():
-            self.log("PASS", "Device Tree", "BCM2711 DTB found")
+    def _run_size(self, spec, paths):
+        """Spec kind "size": path is present, report its size"""
+        path = paths[0]
+        st = self._stat(path)
+        if st is not None:
+            size_mb = st.st_size * _INV_MB
+            self.log("PASS", spec.name, spec.pass_msg.format(path=path),
+                     f"Size: {size_mb:.1f} MB")
         else:
-            self.log("FAIL", "Device Tree", "DTB for RPi4 not found")
-    
-    def test_rootfs_exists(self):
-        """Test 4: Check root filesystem"""
-        rootfs = self.images / "rootfs.ext4"
-        if rootfs.exists():
-            size_mb = rootfs.stat().st_size / (1024**2)
-            self.log("PASS", "Root Filesystem", "ext4 rootfs found", 
-                    f"Size: {size_mb:.1f} MB")
+            self._spec_fail(spec, path)
+    
+    def _run_content(self, spec, paths):
+        """Spec kind "content": file contains all needles"""
+        path = paths[0]
+        content = self._read_bytes_or_none(path)
+        if content is None:
+            self._spec_fail(spec, path)
+        elif all(needle in content for needle in spec.needles):
+            self.log("PASS", spec.name, spec.pass_msg.format(path=path))
         else:
-            self.log("FAIL", "Root Filesystem", "rootfs.ext4 not found")
+            self.log("WARN", spec.name, spec.warn_msg)
     
-    def test_boot_partition(self):
-        """Test 5: Check boot partition"""
-        boot_vfat = self.images / "boot.vfat"
-        if boot_vfat.exists():
-            self.log("PASS", "Boot Partition", "boot.vfat created")
+    def _run_group(self, spec, paths):
+        """Spec kind "group": at least one of paths is present"""
+        found = [p for p in paths if self._present(p)]
+        if found:
+            self.log("PASS", spec.name,
+                     spec.pass_msg.format(found=len(found), total=len(paths)))
         else:
-            self.log("FAIL", "Boot Partition", "boot.vfat not found")
+            self.log("FAIL", spec.name, spec.fail_msg)
     
-    def test_python_in_rootfs(self):
-        """Test 6: Check Python3 installation"""
-        python_paths = [
-            self.target / "usr/bin/python3",
-            self.target / "usr/lib/python3.11",
-        ]
+    def _read_bytes_or_none(self, path):
+        """Return raw file contents, or None if the file is missing"""
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
+    def _have_binary(self, name):
+        """Check for an executable in the target's usr/bin or usr/sbin"""
+        return any(
+            os.access(os.path.join(d, name), os.X_OK)
+            for d in (self.P.usr_bin, self.P.usr_sbin)
+        )
+    
+    def run_cmd(self, cmd, cwd=None):
+        """Run command (argv list, no shell) and return output
         
-        found = [p for p in python_paths if p.exists()]
-        if len(found) >= 1:
-            self.log("PASS", "Python3", f"Found {len(found)}/2 components")
-        else:
-            self.log("FAIL", "Python3", "Python3 not found in rootfs")
+        cmd used to be a shell string; strings are now rejected rather
+        than being run as a single program name.
+        """
+        if isinstance(cmd, str):
+            raise TypeError("run_cmd() takes an argv list, not a shell string")
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, 
+                text=True, cwd=cwd, timeout=10
+            )
+            return result.returncode == 0, result.stdout, result.stderr
+        except Exception as e:
+            return False, "", str(e)
     
     def test_opencv_libs(self):
-        """Test 7: Check OpenCV libraries"""
+        """Check OpenCV libraries"""
         opencv_patterns = ["libopencv_core.so", "libopencv_imgproc.so"]
-        lib_dir = self.target / "usr/lib"
+        entries = self._subtree("usr/lib")
         
-        if lib_dir.exists():
-            found = []
-            for pattern in opencv_patterns:
-                matches = list(lib_dir.glob(f"**/{pattern}*"))
-                if matches:
-                    found.append(pattern)
+        if entries is not None:
+            names = {entry.name for entry in entries}
+            found = [p for p in opencv_patterns if any(n.startswith(p) for n in names)]
             
             if len(found) >= 1:
                 self.log("PASS", "OpenCV4", f"Found {len(found)} core libraries")
@@ -144,70 +462,29 @@ class PioneerValidator:
         else:
             self.log("WARN", "OpenCV4", "Cannot verify (lib dir not accessible)")
     
-    def test_network_config(self):
-        """Test 8: Check network configuration"""
-        net_config = self.buildroot / "board/raspberrypi/overlay/etc/network/interfaces"
-        
-        if net_config.exists():
-            content = net_config.read_text()
-            if "192.168.1.10" in content and "eth0" in content:
-                self.log("PASS", "Network Config", "Static IP configured (192.168.1.10)")
-            else:
-                self.log("WARN", "Network Config", "Config exists but may be incomplete")
-        else:
-            self.log("FAIL", "Network Config", "Network interfaces file missing")
-    
-    def test_ssh_server(self):
-        """Test 9: Check SSH server (Dropbear)"""
-        dropbear_paths = [
-            self.target / "usr/sbin/dropbear",
-            self.target / "etc/init.d/S50dropbear"
-        ]
-        
-        found = [p for p in dropbear_paths if p.exists()]
-        if len(found) >= 1:
-            self.log("PASS", "SSH Server", f"Dropbear found ({len(found)}/2 files)")
-        else:
-            self.log("FAIL", "SSH Server", "Dropbear not found")
-    
-    def test_i2c_tools(self):
-        """Test 10: Check I2C tools"""
-        i2c_detect = self.target / "usr/sbin/i2cdetect"
-        
-        if i2c_detect.exists():
-            self.log("PASS", "I2C Tools", "i2cdetect found")
-        else:
-            self.log("WARN", "I2C Tools", "i2c-tools not confirmed")
-    
     def test_kernel_modules(self):
-        """Test 11: Check kernel modules"""
-        modules_dir = self.target / "lib/modules"
-        
-        if modules_dir.exists():
-            module_dirs = list(modules_dir.iterdir())
-            if module_dirs:
-                self.log("PASS", "Kernel Modules", f"Found modules directory")
-            else:
-                self.log("WARN", "Kernel Modules", "Modules directory empty")
-        else:
+        """Check kernel modules"""
+        # Only non-emptiness matters, so stop at the first entry rather
+        # than listing the tree through the index
+        try:
+            with os.scandir(self.P.modules) as it:
+                nonempty = next(it, None) is not None
+        except OSError:
             self.log("WARN", "Kernel Modules", "Cannot verify modules")
-    
-    def test_rootfs_overlay(self):
-        """Test 12: Check custom overlay applied"""
-        startup_script = self.target / "etc/init.d/S99robotics"
+            return
         
-        if startup_script.exists():
-            self.log("PASS", "Custom Overlay", "Robotics startup script present")
+        if nonempty:
+            self.log("PASS", "Kernel Modules", f"Found modules directory")
         else:
-            self.log("WARN", "Custom Overlay", "Startup script not found")
+            self.log("WARN", "Kernel Modules", "Modules directory empty")
     
     def test_wifi_config(self):
-        """Test 13: Check WiFi configuration"""
-        wpa_conf = self.target / "etc/wpa_supplicant.conf"
+        """Check WiFi configuration"""
+        wpa_conf = self.P.wpa_conf
         
-        if wpa_conf.exists():
-            content = wpa_conf.read_text()
-            if "YOUR_SSID" in content:
+        content = self._read_bytes_or_none(wpa_conf)
+        if content is not None:
+            if b"YOUR_SSID" in content:
                 self.log("WARN", "WiFi Config", "Default credentials not changed")
             else:
                 self.log("PASS", "WiFi Config", "WiFi credentials configured")
@@ -215,123 +492,119 @@ class PioneerValidator:
             self.log("WARN", "WiFi Config", "wpa_supplicant.conf not found")
     
     def test_utilities(self):
-        """Test 14: Check system utilities"""
-        utils = ["htop", "nano", "file"]
-        found = []
+        """Check system utilities"""
+        entries = self._subtree("usr/bin")
         
-        for util in utils:
-            util_path = self.target / f"usr/bin/{util}"
-            if util_path.exists():
-                found.append(util)
+        if entries is None:
+            self.log("WARN", "System Utilities", "usr/bin missing")
+            return
         
+        # Only the wanted names are resolved; usr/bin is mostly busybox
+        # symlinks, so following every entry would cost a stat each
+        found = [u for u in _UTILITIES if self._present(os.path.join(self.P.usr_bin, u))]
         if len(found) >= 2:
-            self.log("PASS", "System Utilities", f"Found {len(found)}/{len(utils)} tools")
+            self.log("PASS", "System Utilities", f"Found {len(found)}/{len(_UTILITIES)} tools")
         else:
-            self.log("WARN", "System Utilities", f"Only {len(found)}/{len(utils)} tools found")
+            self.log("WARN", "System Utilities", f"Only {len(found)}/{len(_UTILITIES)} tools found")
     
     def test_firmware_files(self):
-        """Test 15: Check Raspberry Pi firmware"""
-        firmware_files = ["start4.elf", "fixup4.dat"]
-        rpi_fw_dir = self.images / "rpi-firmware"
+        """Check Raspberry Pi firmware"""
+        fw_set = self._listing(self.P.rpi_firmware)
         
-        if rpi_fw_dir.exists():
-            found = [f for f in firmware_files if (rpi_fw_dir / f).exists()]
-            if len(found) == len(firmware_files):
-                self.log("PASS", "RPi Firmware", "All firmware files present")
-            else:
-                self.log("WARN", "RPi Firmware", f"Found {len(found)}/{len(firmware_files)} files")
-        else:
+        if fw_set is None:
             self.log("FAIL", "RPi Firmware", "Firmware directory not found")
+            return
+        
+        missing = _FIRMWARE_FILES - fw_set
+        if not missing:
+            self.log("PASS", "RPi Firmware", "All firmware files present")
+        else:
+            found = len(_FIRMWARE_FILES) - len(missing)
+            self.log("WARN", "RPi Firmware", f"Found {found}/{len(_FIRMWARE_FILES)} files")
     
     def test_image_size(self):
-        """Test 16: Validate image size"""
-        img_path = self.images / "sdcard.img"
+        """Validate image size"""
+        img_path = self.P.sdcard
         
-        if img_path.exists():
-            size_gb = img_path.stat().st_size / (1024**3)
-            if 1.5 <= size_gb <= 4:
+        st = self._stat(img_path)
+        if st is not None:
+            size = st.st_size
+            size_gb = size * _INV_GB
+            if _IMG_MIN_BYTES <= size <= _IMG_MAX_BYTES:
                 self.log("PASS", "Image Size", f"Size OK ({size_gb:.2f} GB)")
-            elif size_gb < 1.5:
+            elif size < _IMG_MIN_BYTES:
                 self.log("WARN", "Image Size", f"Smaller than expected ({size_gb:.2f} GB)")
             else:
                 self.log("WARN", "Image Size", f"Larger than expected ({size_gb:.2f} GB)")
     
-    def test_toolchain(self):
-        """Test 17: Check cross-compilation toolchain"""
-        gcc = self.host / "bin/aarch64-buildroot-linux-gnu-gcc"
-        
-        if gcc.exists():
-            self.log("PASS", "Toolchain", "Cross-compiler present")
-        else:
-            self.log("WARN", "Toolchain", "Cross-compiler not found")
-    
     def generate_report(self):
         """Generate final validation report"""
+        self._flush_output()
+        
         print("\n" + "="*70)
-        print(f"{Colors.BLUE}PIONEROS VALIDATION REPORT{Colors.END}")
+        print(f"{_BLUE}PIONEROS VALIDATION REPORT{_END}")
         print("="*70)
         
-        total = self.results["summary"]["passed"] + self.results["summary"]["failed"] + self.results["summary"]["warnings"]
-        passed = self.results["summary"]["passed"]
-        failed = self.results["summary"]["failed"]
-        warnings = self.results["summary"]["warnings"]
+        passed = self._summary["passed"]
+        failed = self._summary["failed"]
+        warnings = self._summary["warnings"]
+        total = passed + failed + warnings
         
         print(f"\nTotal Tests: {total}")
-        print(f"{Colors.GREEN}✓ Passed: {passed}{Colors.END}")
-        print(f"{Colors.RED}✗ Failed: {failed}{Colors.END}")
-        print(f"{Colors.YELLOW}⚠ Warnings: {warnings}{Colors.END}")
+        print(f"{_GREEN}✓ Passed: {passed}{_END}")
+        print(f"{_RED}✗ Failed: {failed}{_END}")
+        print(f"{_YELLOW}⚠ Warnings: {warnings}{_END}")
         
         # Readiness assessment
         print("\n" + "-"*70)
         if failed == 0 and passed >= 12:
-            print(f"{Colors.GREEN}STATUS: READY FOR DEPLOYMENT ✓{Colors.END}")
+            print(f"{_GREEN}STATUS: READY FOR DEPLOYMENT ✓{_END}")
             print("System passed all critical tests. Safe to flash to SD card.")
         elif failed <= 2 and warnings <= 3:
-            print(f"{Colors.YELLOW}STATUS: CONDITIONAL PASS ⚠{Colors.END}")
+            print(f"{_YELLOW}STATUS: CONDITIONAL PASS ⚠{_END}")
             print("System mostly functional. Review warnings before deployment.")
         else:
-            print(f"{Colors.RED}STATUS: NOT READY ✗{Colors.END}")
+            print(f"{_RED}STATUS: NOT READY ✗{_END}")
             print("Critical failures detected. Fix issues before flashing.")
         
-        # Save JSON report
-        report_path = self.buildroot / "validation_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        # Finish JSON report
+        if self._report_fh is None and self._report_error is None:
+            self._open_report()
+        if self._report_fh is not None:
+            self._close_report()
         
-        print(f"\nDetailed report saved: {report_path}")
+        if self._report_error is None:
+            print(f"\nDetailed report saved: {self.report_path}")
+        else:
+            print(f"\n{_RED}Report not saved: {self._report_error}{_END}")
         print("="*70 + "\n")
     
     def run_all_tests(self):
         """Execute all validation tests"""
-        print(f"\n{Colors.BLUE}Starting PioneerOS Validation...{Colors.END}\n")
-        
-        # Critical tests
-        self.test_image_exists()
-        self.test_kernel_exists()
-        self.test_dtb_exists()
-        self.test_rootfs_exists()
-        self.test_boot_partition()
-        
-        # Software tests
-        self.test_python_in_rootfs()
-        self.test_opencv_libs()
-        self.test_ssh_server()
-        self.test_i2c_tools()
+        print(f"\n{_BLUE}Starting PioneerOS Validation...{_END}\n")
         
-        # Configuration tests
-        self.test_network_config()
-        self.test_wifi_config()
-        self.test_rootfs_overlay()
+        self._index_target()
+        self._listing(self.P.rpi_firmware)
         
-        # System tests
-        self.test_kernel_modules()
-        self.test_utilities()
-        self.test_firmware_files()
-        self.test_image_size()
-        self.test_toolchain()
+        tests = [
+            partial(self._run_spec, t) if isinstance(t, TestSpec) else getattr(self, t)
+            for t in _TESTS
+        ]
         
-        # Generate report
-        self.generate_report()
+        try:
+            # Tests are independent and I/O-bound, so overlap their syscalls,
+            # but emit each test's records in _TESTS order so output is stable
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                for records in ex.map(self._run_job, tests):
+                    for record in records:
+                        self._emit(*record)
+            
+            # Generate report
+            self.generate_report()
+        finally:
+            self._flush_output()
+            if self._report_fh is not None:
+                self._discard_report()
 
 if __name__ == "__main__":
     validator = PioneerValidator()